@@ -29,10 +29,16 @@ Notes
   that this script follows.
 """
 
+import asyncio
+import operator
+import socket
+import struct
+import sys
 import time
-from typing import Dict, List, Optional
+from collections import ChainMap
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
-from pymodbus.client import ModbusUdpClient
+from pymodbus.client import AsyncModbusUdpClient
 
 # ---------------------------------------------------------------------------
 # Configuration parameters
@@ -50,30 +56,79 @@ PORT: int = 502
 #: For Ethernet/UDP devices on Victron, this is typically 1.
 DEVICE_ID: int = 1
 
+#: Requested kernel send/receive buffer size for the UDP socket (bytes).
+#: Larger buffers avoid dropped responses at short polling intervals.
+SOCKET_BUFFER_SIZE: int = 1 << 20
+
+#: IP type-of-service byte for outgoing requests (0x10 = IPTOS_LOWDELAY).
+IP_TOS_LOWDELAY: int = 0x10
+
+#: Polling period in seconds (recommended: 0.5–1.0 s for this meter).
+POLL_INTERVAL: float = 1.0
+
 
 # ---------------------------------------------------------------------------
 # Helper functions for numeric decoding
 # ---------------------------------------------------------------------------
 
-def _twos_complement(value: int, bits: int) -> int:
+#: Precompiled big-endian decoders; two's complement is handled by the
+#: signed formats, so no Python-level sign fixup is needed.
+_S16 = struct.Struct(">h")
+_U16 = struct.Struct(">H")
+_S32 = struct.Struct(">i")
+_U32 = struct.Struct(">I")
+_U16X2 = struct.Struct(">HH")
+
+#: struct format code for each (width in bits, signed) combination.
+_FORMAT_CODES: Dict[Tuple[int, bool], str] = {
+    (16, True): "h",
+    (16, False): "H",
+    (32, True): "i",
+    (32, False): "I",
+}
+
+
+def registers_to_bytes(registers: List[int]) -> bytes:
     """
-    Convert an unsigned integer to a signed integer using two's complement.
+    Pack 16-bit register values into a big-endian byte buffer.
 
     Parameters
     ----------
-    value : int
-        Raw integer value (e.g. from a Modbus register).
-    bits : int
-        Number of bits of the value (16 or 32).
+    registers : list[int]
+        Register values as returned by pymodbus.
 
     Returns
     -------
-    int
-        Signed integer representation.
+    bytes
+        ``2 * len(registers)`` bytes, high byte of each register first.
     """
-    if value & (1 << (bits - 1)):
-        value -= 1 << bits
-    return value
+    return struct.pack(f">{len(registers)}H", *registers)
+
+
+#: Decoder for a block: (struct layout, keys, scales), see _block_layout().
+BlockLayout = Tuple[struct.Struct, Tuple[str, ...], Tuple[float, ...]]
+
+
+def decode_block(
+    buf: bytes,
+    layout: BlockLayout,
+    out: Dict[str, Optional[float]],
+) -> None:
+    """
+    Decode and scale every value of a register block into `out`.
+
+    Parameters
+    ----------
+    buf : bytes
+        Raw big-endian register data of the block (see `registers_to_bytes`).
+    layout : tuple
+        (decoder, keys, scales) as built by `_block_layout`.
+    out : dict[str, float or None]
+        Mapping updated in place with one scaled value per key.
+    """
+    decoder, keys, scales = layout
+    # One C-level unpack returns every raw value of the block in key order.
+    out.update(zip(keys, map(operator.mul, decoder.unpack_from(buf), scales)))
 
 
 def decode_int16(registers: List[int], signed: bool = True) -> int:
@@ -103,7 +158,7 @@ def decode_int16(registers: List[int], signed: bool = True) -> int:
 
     raw = registers[0] & 0xFFFF
     if signed:
-        return _twos_complement(raw, 16)
+        return _S16.unpack(_U16.pack(raw))[0]
     return raw
 
 
@@ -135,31 +190,114 @@ def decode_int32(registers: List[int], signed: bool = True) -> int:
 
     hi = registers[0] & 0xFFFF
     lo = registers[1] & 0xFFFF
-    raw = (hi << 16) | lo
     if signed:
-        return _twos_complement(raw, 32)
-    return raw
+        return _S32.unpack(_U16X2.pack(hi, lo))[0]
+    return (hi << 16) | lo
+
+
+# ---------------------------------------------------------------------------
+# Socket tuning
+# ---------------------------------------------------------------------------
+
+def tune_socket(client: AsyncModbusUdpClient) -> Optional[Tuple[int, int]]:
+    """
+    Enlarge the socket buffers and request low-delay TOS on the client's UDP
+    socket.
+
+    Must be called after the client is connected. Options the platform does
+    not support are skipped.
+
+    Parameters
+    ----------
+    client : AsyncModbusUdpClient
+        Connected Modbus/UDP client.
+
+    Returns
+    -------
+    tuple[int, int] or None
+        (receive, send) buffer sizes actually granted by the kernel, or None
+        if the underlying socket could not be reached.
+
+    Notes
+    -----
+    pymodbus 3.x keeps the asyncio transport on `client.ctx.transport`;
+    older releases use `client.transport`.
+    """
+    transport = getattr(getattr(client, "ctx", None), "transport", None)
+    if transport is None:
+        transport = getattr(client, "transport", None)
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None:
+        return None
+
+    options = [
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE),
+    ]
+    if hasattr(socket, "IP_TOS"):
+        options.append((socket.IPPROTO_IP, socket.IP_TOS, IP_TOS_LOWDELAY))
+    for level, option, value in options:
+        try:
+            sock.setsockopt(level, option, value)
+        except OSError:
+            pass
+
+    return (
+        sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+        sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+    )
 
 
 # ---------------------------------------------------------------------------
 # Modbus register reading helpers
 # ---------------------------------------------------------------------------
 
-def read_input_or_holding(
-    client: ModbusUdpClient,
+#: Keyword arguments shared by every register read.
+#: pymodbus 3.x stable uses `slave`, newer releases use `device_id`.
+_READ_KW: Dict[str, int] = {"device_id": DEVICE_ID}
+
+#: Bound read method (input or holding registers) that succeeded for each
+#: (address, count). For a cached request, read_input_or_holding() calls
+#: only this method on the same client and skips the fallback.
+_READERS: Dict[Tuple[int, int], Callable[..., Awaitable[Any]]] = {}
+
+#: Function code that succeeded most recently (4 = input, 3 = holding
+#: registers). Requests not yet in `_READERS` try this one first, so a
+#: meter that only answers holding registers does not pay a failed input
+#: register round-trip for every new address.
+_PREFERRED_FC: int = 4
+
+#: Modbus exception codes that mean a request can never succeed:
+#: 1 = ILLEGAL FUNCTION, 2 = ILLEGAL DATA ADDRESS. Other codes (e.g. 6 =
+#: DEVICE BUSY, 0x0A/0x0B = gateway errors) are temporary.
+_PERMANENT_EXCEPTION_CODES: Tuple[int, ...] = (1, 2)
+
+#: (address, count) requests the meter rejected with a permanent exception
+#: code for both function codes. read_input_or_holding() returns None for
+#: these without sending them.
+_REJECTED: Set[Tuple[int, int]] = set()
+
+
+async def read_input_or_holding(
+    client: AsyncModbusUdpClient,
     address: int,
     count: int = 1,
-) -> Optional[List[int]]:
+) -> Optional[bytes]:
     """
     Read a block of registers from the VM-3P75CT.
 
     This function tries Input Registers (function code 4) first, then
-    falls back to Holding Registers (function code 3) if needed.
+    falls back to Holding Registers (function code 3) if needed. The
+    function code that succeeds is remembered per (address, count) in
+    `_READERS` and used alone for later identical reads on the same client.
+    A request the meter rejects with ILLEGAL FUNCTION or ILLEGAL DATA
+    ADDRESS for both function codes is remembered in `_REJECTED` and not
+    sent again; other errors are retried on the next call.
 
     Parameters
     ----------
-    client : ModbusUdpClient
-        An instance of the pymodbus UDP client, already connected.
+    client : AsyncModbusUdpClient
+        An instance of the pymodbus asyncio UDP client, already connected.
     address : int
         Modbus register address to start reading from (0-based, hex in docs).
     count : int, optional
@@ -167,40 +305,54 @@ def read_input_or_holding(
 
     Returns
     -------
-    list[int] or None
-        If successful, returns a list of `count` register values (ints).
-        If both reads fail, returns None.
+    bytes or None
+        If successful, returns the `count` registers as ``2 * count``
+        big-endian bytes, ready for `struct` decoding. If the read fails,
+        returns None.
 
     Notes
     -----
     - pymodbus 3.x stable uses parameter name `slave=DEVICE_ID`
     - pymodbus 4.x dev uses `device_id=DEVICE_ID`
     This script uses `device_id`. If you get "unexpected keyword 'device_id'",
-    replace `device_id=DEVICE_ID` with `slave=DEVICE_ID` in the two calls below.
+    replace the `"device_id"` key of `_READ_KW` with `"slave"`.
     """
-    # Try Input Registers (function 4)
-    rr = client.read_input_registers(
-        address=address,
-        count=count,
-        device_id=DEVICE_ID,
-    )
-    if rr is not None and not rr.isError():
-        return rr.registers
-
-    # Fallback: Holding Registers (function 3)
-    rr = client.read_holding_registers(
-        address=address,
-        count=count,
-        device_id=DEVICE_ID,
-    )
-    if rr is not None and not rr.isError():
-        return rr.registers
+    global _PREFERRED_FC
 
+    if (address, count) in _REJECTED:
+        return None
+
+    reader = _READERS.get((address, count))
+    if reader is not None and getattr(reader, "__self__", None) is client:
+        rr = await reader(address=address, count=count, **_READ_KW)
+        if rr is not None and not rr.isError():
+            return registers_to_bytes(rr.registers)
+        return None
+
+    # Try Input Registers (function 4) and Holding Registers (function 3),
+    # starting with the one that worked most recently.
+    readers = [(4, client.read_input_registers), (3, client.read_holding_registers)]
+    if _PREFERRED_FC == 3:
+        readers.reverse()
+    permanent = True
+    for fc, reader in readers:
+        rr = await reader(address=address, count=count, **_READ_KW)
+        if rr is not None and not rr.isError():
+            _READERS[address, count] = reader
+            _PREFERRED_FC = fc
+            return registers_to_bytes(rr.registers)
+        if getattr(rr, "exception_code", None) not in _PERMANENT_EXCEPTION_CODES:
+            permanent = False
+
+    # The meter said this request is invalid for both function codes; it
+    # will keep saying so, so do not send it again.
+    if permanent:
+        _REJECTED.add((address, count))
     return None
 
 
-def read_int16_scaled(
-    client: ModbusUdpClient,
+async def read_int16_scaled(
+    client: AsyncModbusUdpClient,
     address: int,
     scale: float = 1.0,
     signed: bool = True,
@@ -210,7 +362,7 @@ def read_int16_scaled(
 
     Parameters
     ----------
-    client : ModbusUdpClient
+    client : AsyncModbusUdpClient
         Connected Modbus/UDP client.
     address : int
         Modbus register address (0-based).
@@ -224,16 +376,15 @@ def read_int16_scaled(
     float or None
         Scaled floating-point value, or None if reading failed.
     """
-    regs = read_input_or_holding(client, address, count=1)
-    if regs is None:
+    buf = await read_input_or_holding(client, address, count=1)
+    if buf is None:
         return None
 
-    raw = decode_int16(regs, signed=signed)
-    return raw * scale
+    return (_S16 if signed else _U16).unpack(buf)[0] * scale
 
 
-def read_int32_scaled(
-    client: ModbusUdpClient,
+async def read_int32_scaled(
+    client: AsyncModbusUdpClient,
     address: int,
     scale: float = 1.0,
     signed: bool = True,
@@ -243,7 +394,7 @@ def read_int32_scaled(
 
     Parameters
     ----------
-    client : ModbusUdpClient
+    client : AsyncModbusUdpClient
         Connected Modbus/UDP client.
     address : int
         Start address of the 32-bit value (two consecutive registers).
@@ -257,24 +408,283 @@ def read_int32_scaled(
     float or None
         Scaled floating-point value, or None if reading failed.
     """
-    regs = read_input_or_holding(client, address, count=2)
-    if regs is None:
+    buf = await read_input_or_holding(client, address, count=2)
+    if buf is None:
         return None
 
-    raw = decode_int32(regs, signed=signed)
-    return raw * scale
+    return (_S32 if signed else _U32).unpack(buf)[0] * scale
+
+
+async def read_block(
+    client: AsyncModbusUdpClient,
+    start: int,
+    count: int,
+) -> Optional[bytes]:
+    """
+    Read a contiguous block of registers in a single Modbus transaction.
+
+    Parameters
+    ----------
+    client : AsyncModbusUdpClient
+        Connected Modbus/UDP client.
+    start : int
+        First register address of the block (0-based).
+    count : int
+        Number of 16-bit registers in the block (at most 125 per request).
+
+    Returns
+    -------
+    bytes or None
+        The `count` registers as big-endian bytes, or None if the meter
+        rejected the block.
+    """
+    return await read_input_or_holding(client, start, count=count)
+
+
+# ---------------------------------------------------------------------------
+# Register map
+# ---------------------------------------------------------------------------
+
+#: Every value read by read_all(), as (key, address, width in bits, scale,
+#: signed). Register addresses & scales are based on the Home Assistant
+#: VM-3P75CT Modbus config (Kerbal / FVBH).
+READ_PLAN: Tuple[Tuple[str, int, int, float, bool], ...] = (
+    # --------- Sum / system-wide values --------- #
+    # Total active power (W), signed 32-bit
+    ("P_total_W", 0x3080, 32, 1.0, True),
+    # Total forward / reverse energy (kWh), unsigned 32-bit, 0.01 scale
+    ("E_total_forward_kWh", 0x3034, 32, 0.01, False),
+    ("E_total_reverse_kWh", 0x3036, 32, 0.01, False),
+    # PEN voltage (V), signed 16-bit, 0.01 scale
+    ("U_PEN_V", 0x3033, 16, 0.01, True),
+    # Grid frequency (Hz), unsigned 16-bit, 0.01 scale
+    ("freq_Hz", 0x3032, 16, 0.01, False),
+
+    # --------- Phase L1 --------- #
+    # Voltage (V) and current (A), signed 16-bit, 0.01 scale
+    ("U_L1_V", 0x3040, 16, 0.01, True),
+    ("I_L1_A", 0x3041, 16, 0.01, True),
+    # Active power (W), signed 32-bit
+    ("P_L1_W", 0x3082, 32, 1.0, True),
+    # Forward / reverse energy (kWh), uint32, 0.01 scale  (comment in HA config)
+    ("E_L1_forward_kWh", 0x3042, 32, 0.01, False),
+    ("E_L1_reverse_kWh", 0x3044, 32, 0.01, False),
+
+    # --------- Phase L2 --------- #
+    ("U_L2_V", 0x3048, 16, 0.01, True),
+    ("I_L2_A", 0x3049, 16, 0.01, True),
+    ("P_L2_W", 0x3086, 32, 1.0, True),
+    ("E_L2_forward_kWh", 0x304A, 32, 0.01, False),
+    ("E_L2_reverse_kWh", 0x304C, 32, 0.01, False),
+
+    # --------- Phase L3 --------- #
+    ("U_L3_V", 0x3050, 16, 0.01, True),
+    ("I_L3_A", 0x3051, 16, 0.01, True),
+    ("P_L3_W", 0x308A, 32, 1.0, True),
+    ("E_L3_forward_kWh", 0x3052, 32, 0.01, False),
+    ("E_L3_reverse_kWh", 0x3054, 32, 0.01, False),
+)
+
+#: Contiguous register blocks covering READ_PLAN, as (start, count):
+#: - 0x3032..0x3055: frequency, PEN voltage, total and per-phase energy,
+#:   per-phase voltage/current
+#: - 0x3080..0x308B: total and per-phase active power
+READ_BLOCKS: Tuple[Tuple[int, int], ...] = (
+    (0x3032, 0x3056 - 0x3032),
+    (0x3080, 0x308C - 0x3080),
+)
+
+
+def _block_layout(
+    start: int,
+    count: int,
+    entries: Tuple[Tuple[str, int, int, float, bool], ...],
+) -> BlockLayout:
+    """
+    Build one struct layout that decodes every entry of a block at once.
+
+    Registers between entries become pad bytes, so a single
+    ``unpack_from`` on the block buffer returns all raw values in order.
+
+    Returns
+    -------
+    tuple
+        (decoder, keys, scales), with `keys` and `scales` in the same order
+        as the values returned by the decoder.
+
+    Raises
+    ------
+    ValueError
+        If two entries overlap.
+    """
+    fmt = [">"]
+    keys: List[str] = []
+    scales: List[float] = []
+    pos = start
+    for key, address, width, scale, signed in sorted(entries, key=lambda e: e[1]):
+        if address < pos:
+            raise ValueError(f"{key} at 0x{address:04X} overlaps another READ_PLAN entry")
+        if address > pos:
+            fmt.append(f"{2 * (address - pos)}x")
+        fmt.append(_FORMAT_CODES[width, signed])
+        keys.append(key)
+        scales.append(scale)
+        pos = address + width // 16
+    if pos < start + count:
+        fmt.append(f"{2 * (start + count - pos)}x")
+    return struct.Struct("".join(fmt)), tuple(keys), tuple(scales)
+
+
+#: One block of the read plan: (start, count, READ_PLAN entries, layout).
+BlockPlan = Tuple[int, int, Tuple[Tuple[str, int, int, float, bool], ...], BlockLayout]
+
+
+def _group_plan_by_block(
+    plan: Tuple[Tuple[str, int, int, float, bool], ...],
+    blocks: Tuple[Tuple[int, int], ...],
+) -> Tuple[BlockPlan, ...]:
+    """
+    Split `plan` into one sub-plan per block.
+
+    Each result is (start, count, entries, layout), where `entries` are the
+    READ_PLAN entries inside the block and `layout` is the block decoder
+    built by `_block_layout`.
+
+    Raises
+    ------
+    ValueError
+        If a plan entry is not fully contained in one of `blocks`.
+    """
+    grouped: List[List[Tuple[str, int, int, float, bool]]] = [[] for _ in blocks]
+    for entry in plan:
+        key, address, width = entry[0], entry[1], entry[2]
+        for i, (start, count) in enumerate(blocks):
+            if start <= address and address + width // 16 <= start + count:
+                grouped[i].append(entry)
+                break
+        else:
+            raise ValueError(f"{key} at 0x{address:04X} is not covered by READ_BLOCKS")
+    return tuple(
+        (start, count, tuple(entries), _block_layout(start, count, tuple(entries)))
+        for (start, count), entries in zip(blocks, grouped)
+    )
+
+
+def _split_contiguous(
+    start: int,
+    count: int,
+    entries: Tuple[Tuple[str, int, int, float, bool], ...],
+) -> Tuple[BlockPlan, ...]:
+    """
+    Split the entries of a block into runs of back-to-back registers.
+
+    For example the L1 voltage, current and energies at 0x3040..0x3045 form
+    one six-register run. Returns an empty tuple if the whole block is a
+    single run, since retrying it as a span would not help.
+    """
+    runs: List[List[Tuple[str, int, int, float, bool]]] = []
+    end = None
+    for entry in sorted(entries, key=lambda e: e[1]):
+        address, width = entry[1], entry[2]
+        if address != end:
+            runs.append([])
+        runs[-1].append(entry)
+        end = address + width // 16
+
+    spans = []
+    for run in runs:
+        span_start = run[0][1]
+        span_count = run[-1][1] + run[-1][2] // 16 - span_start
+        spans.append(
+            (span_start, span_count, tuple(run), _block_layout(span_start, span_count, tuple(run)))
+        )
+    if len(spans) == 1 and spans[0][:2] == (start, count):
+        return ()
+    return tuple(spans)
+
+
+def _single_value_plans(
+    entries: Tuple[Tuple[str, int, int, float, bool], ...],
+) -> Tuple[BlockPlan, ...]:
+    """
+    Turn each entry into its own one- or two-register read.
+    """
+    plans = []
+    for entry in entries:
+        address, count = entry[1], entry[2] // 16
+        plans.append((address, count, (entry,), _block_layout(address, count, (entry,))))
+    return tuple(plans)
+
+
+def _build_retry_plans(
+    block_plans: Tuple[BlockPlan, ...],
+) -> Dict[Tuple[int, int], Tuple[BlockPlan, ...]]:
+    """
+    Map each read (start, count) to the smaller reads that replace it if the
+    meter rejects it: a block becomes its contiguous spans, a span becomes
+    one read per value. Single-value reads have no entry.
+    """
+    retry: Dict[Tuple[int, int], Tuple[BlockPlan, ...]] = {}
+    for start, count, entries, _ in block_plans:
+        spans = _split_contiguous(start, count, entries)
+        if spans:
+            retry[start, count] = spans
+            for span_start, span_count, span_entries, _ in spans:
+                if len(span_entries) > 1:
+                    retry[span_start, span_count] = _single_value_plans(span_entries)
+        elif len(entries) > 1:
+            retry[start, count] = _single_value_plans(entries)
+    return retry
+
+
+_BLOCK_PLANS = _group_plan_by_block(READ_PLAN, READ_BLOCKS)
+
+#: Smaller reads used by read_all() when the meter rejects a block (e.g.
+#: because it does not allow reads across unmapped registers) or a span,
+#: keyed by the rejected read's (start, count).
+_RETRY_PLANS = _build_retry_plans(_BLOCK_PLANS)
+
+#: Keys used for the power factor of each phase, as (PF, P, U, I).
+PHASE_KEYS: Tuple[Tuple[str, str, str, str], ...] = tuple(
+    (f"PF_L{n}", f"P_L{n}_W", f"U_L{n}_V", f"I_L{n}_A") for n in (1, 2, 3)
+)
+
+#: Result mapping reused by read_all() across polls, with every key it sets.
+_RESULT: Dict[str, Optional[float]] = dict.fromkeys(
+    [key for key, *_ in READ_PLAN] + [pf_key for pf_key, *_ in PHASE_KEYS] + ["PF_total"]
+)
 
 
 # ---------------------------------------------------------------------------
 # Core data acquisition: read_all() + power factor computation
 # ---------------------------------------------------------------------------
 
-def read_all(client: ModbusUdpClient) -> Dict[str, Optional[float]]:
+async def _read_plan_block(
+    client: AsyncModbusUdpClient,
+    block_plan: BlockPlan,
+) -> Tuple[BlockPlan, Optional[bytes]]:
+    """
+    Read the registers of one `_BLOCK_PLANS` entry.
+
+    Returns the entry together with the register bytes (or None), so results
+    can be matched to their block in completion order.
+    """
+    start, count = block_plan[0], block_plan[1]
+    return block_plan, await read_block(client, start, count)
+
+
+async def read_all(
+    client: AsyncModbusUdpClient,
+    out: Optional[Dict[str, Optional[float]]] = None,
+) -> Dict[str, Optional[float]]:
     """
     Read a set of useful measurements from the VM-3P75CT.
 
-    Register addresses & scales are based on:
-    - Home Assistant VM-3P75CT Modbus config (Kerbal / FVBH) :contentReference[oaicite:2]{index=2}
+    The values to read are listed in `READ_PLAN`. They are fetched with one
+    request per entry of `READ_BLOCKS` instead of one request per register.
+    If the meter rejects a block, it is retried as runs of back-to-back
+    registers, and a rejected run as one read per value (see
+    `_RETRY_PLANS`). Every successful read is decoded by `decode_block`.
 
     Values read
     -----------
@@ -287,85 +697,57 @@ def read_all(client: ModbusUdpClient) -> Dict[str, Optional[float]]:
 
     Parameters
     ----------
-    client : ModbusUdpClient
+    client : AsyncModbusUdpClient
         Connected Modbus/UDP client.
+    out : dict[str, float or None], optional
+        Mapping to fill in place. Defaults to the module-level `_RESULT`,
+        which is reused by every call, so callers that keep results across
+        polls must copy them.
 
     Returns
     -------
     dict[str, float or None]
-        Mapping of measurement names to values (floats). Values are None if
-        the underlying Modbus read failed.
+        `out`, mapping measurement names to values (floats). Values are None
+        if the underlying Modbus read failed.
     """
-    data: Dict[str, Optional[float]] = {}
+    data = _RESULT if out is None else out
 
-    # --------- Sum / system-wide values --------- #
-    # Total active power (W), signed 32-bit at 0x3080
-    data["P_total_W"] = read_int32_scaled(client, 0x3080, scale=1.0, signed=True)
-
-    # Total forward energy (kWh), unsigned 32-bit, 0.01 scale at 0x3034
-    data["E_total_forward_kWh"] = read_int32_scaled(
-        client, 0x3034, scale=0.01, signed=False
-    )
-
-    # Total reverse energy (kWh), unsigned 32-bit, 0.01 scale at 0x3036
-    data["E_total_reverse_kWh"] = read_int32_scaled(
-        client, 0x3036, scale=0.01, signed=False
-    )
-
-    # PEN voltage (V), signed 16-bit, 0.01 scale at 0x3033
-    data["U_PEN_V"] = read_int16_scaled(client, 0x3033, scale=0.01, signed=True)
-
-    # Grid frequency (Hz), unsigned 16-bit, 0.01 scale at 0x3032
-    data["freq_Hz"] = read_int16_scaled(client, 0x3032, scale=0.01, signed=False)
-
-    # --------- Phase L1 --------- #
-    # Base block L1 around 0x3040.
-    data["U_L1_V"] = read_int16_scaled(client, 0x3040, scale=0.01, signed=True)
-    data["I_L1_A"] = read_int16_scaled(client, 0x3041, scale=0.01, signed=True)
-    # L1 active power (W), signed 32-bit at 0x3082
-    data["P_L1_W"] = read_int32_scaled(client, 0x3082, scale=1.0, signed=True)
-
-    # L1 forward energy (kWh), uint32 at 0x3042/0x3043, scale 0.01  (comment in HA config)
-    data["E_L1_forward_kWh"] = read_int32_scaled(
-        client, 0x3042, scale=0.01, signed=False
-    )
-
-    # L1 reverse energy (kWh), uint32 at 0x3044/0x3045, scale 0.01
-    data["E_L1_reverse_kWh"] = read_int32_scaled(
-        client, 0x3044, scale=0.01, signed=False
-    )
-
-    # --------- Phase L2 --------- #
-    data["U_L2_V"] = read_int16_scaled(client, 0x3048, scale=0.01, signed=True)
-    data["I_L2_A"] = read_int16_scaled(client, 0x3049, scale=0.01, signed=True)
-    # L2 active power (W), signed 32-bit at 0x3086
-    data["P_L2_W"] = read_int32_scaled(client, 0x3086, scale=1.0, signed=True)
-
-    # L2 forward energy (kWh), uint32 at 0x304A/0x304B, scale 0.01
-    data["E_L2_forward_kWh"] = read_int32_scaled(
-        client, 0x304A, scale=0.01, signed=False
-    )
-
-    # L2 reverse energy (kWh), uint32 at 0x304C/0x304D, scale 0.01
-    data["E_L2_reverse_kWh"] = read_int32_scaled(
-        client, 0x304C, scale=0.01, signed=False
-    )
-
-    # --------- Phase L3 --------- #
-    data["U_L3_V"] = read_int16_scaled(client, 0x3050, scale=0.01, signed=True)
-    data["I_L3_A"] = read_int16_scaled(client, 0x3051, scale=0.01, signed=True)
-    # L3 active power (W), signed 32-bit at 0x308A
-    data["P_L3_W"] = read_int32_scaled(client, 0x308A, scale=1.0, signed=True)
-
-    # L3 forward energy (kWh), uint32 at 0x3052/0x3053, scale 0.01
-    data["E_L3_forward_kWh"] = read_int32_scaled(
-        client, 0x3052, scale=0.01, signed=False
-    )
+    # Submit every block request before waiting on any of them, then decode
+    # each block as soon as its response arrives.
+    tasks = [
+        asyncio.create_task(_read_plan_block(client, block_plan))
+        for block_plan in _BLOCK_PLANS
+    ]
 
-    # L3 reverse energy (kWh), uint32 at 0x3054/0x3055, scale 0.01
-    data["E_L3_reverse_kWh"] = read_int32_scaled(
-        client, 0x3054, scale=0.01, signed=False
-    )
+    submitted = list(tasks)
+    try:
+        while tasks:
+            retry = []
+            for next_done in asyncio.as_completed(tasks):
+                (start, count, plan, layout), block = await next_done
+                if block is not None:
+                    decode_block(block, layout, data)
+                    continue
+
+                # Rejected: retry as smaller reads (block -> spans -> single
+                # values), all submitted together in the next round.
+                smaller = _RETRY_PLANS.get((start, count))
+                if smaller:
+                    for sub in smaller:
+                        task = asyncio.create_task(_read_plan_block(client, sub))
+                        retry.append(task)
+                        submitted.append(task)
+                    continue
+                for key, *_ in plan:
+                    data[key] = None
+            tasks = retry
+    except BaseException:
+        # A read raised (e.g. ModbusIOException on timeout): cancel the other
+        # reads and collect their outcome so none is left unretrieved.
+        for task in submitted:
+            task.cancel()
+        await asyncio.gather(*submitted, return_exceptions=True)
+        raise
 
     # --------- Derived values: power factor (cos φ) --------- #
     # For each phase:
@@ -375,46 +757,32 @@ def read_all(client: ModbusUdpClient) -> Dict[str, Optional[float]]:
     #   cos φ_total = P_total / S_total
     # Values are clipped to [-1.0, 1.0].
 
-    def _pf_for_phase(P: Optional[float], U: Optional[float], I: Optional[float]) -> Optional[float]:
-        if P is None or U is None or I is None:
-            return None
-        denom = U * I
-        if abs(denom) < 1e-6:
-            return None
-        pf = P / denom
-        if pf > 1.0:
-            pf = 1.0
-        if pf < -1.0:
-            pf = -1.0
-        return pf
-
-    # Per-phase PF
-    data["PF_L1"] = _pf_for_phase(data["P_L1_W"], data["U_L1_V"], data["I_L1_A"])
-    data["PF_L2"] = _pf_for_phase(data["P_L2_W"], data["U_L2_V"], data["I_L2_A"])
-    data["PF_L3"] = _pf_for_phase(data["P_L3_W"], data["U_L3_V"], data["I_L3_A"])
-
-    # Total PF
+    # Single pass over the phases: per-phase PF and S_total together. This
+    # cannot be folded into decoding, because P and U/I come from different
+    # blocks whose responses arrive in either order.
+    S_total = 0.0
+    for pf_key, p_key, u_key, i_key in PHASE_KEYS:
+        U = data[u_key]
+        I = data[i_key]
+        if U is None or I is None:
+            data[pf_key] = None
+            continue
+        S = U * I
+        S_abs = abs(S)
+        S_total += S_abs
+        P = data[p_key]
+        if P is None or S_abs < 1e-6:
+            data[pf_key] = None
+        else:
+            pf = P / S
+            data[pf_key] = 1.0 if pf > 1.0 else -1.0 if pf < -1.0 else pf
+
     P_total = data["P_total_W"]
-    if P_total is None:
+    if P_total is None or S_total <= 1e-6:
         data["PF_total"] = None
     else:
-        S_terms = []
-        for phase in ("L1", "L2", "L3"):
-            U = data.get(f"U_{phase}_V")
-            I = data.get(f"I_{phase}_A")
-            if U is not None and I is not None:
-                S_terms.append(abs(U * I))
-
-        S_total = sum(S_terms) if S_terms else 0.0
-        if S_total <= 1e-6:
-            data["PF_total"] = None
-        else:
-            pf_total = P_total / S_total
-            if pf_total > 1.0:
-                pf_total = 1.0
-            if pf_total < -1.0:
-                pf_total = -1.0
-            data["PF_total"] = pf_total
+        pf = P_total / S_total
+        data["PF_total"] = 1.0 if pf > 1.0 else -1.0 if pf < -1.0 else pf
 
     return data
 
@@ -423,24 +791,56 @@ def read_all(client: ModbusUdpClient) -> Dict[str, Optional[float]]:
 # Main loop
 # ---------------------------------------------------------------------------
 
-def main() -> None:
+#: Output for one snapshot, filled from read_all() values with format_map().
+#: The `*_s` fields are the preformatted power factors ("0.987" or "NA").
+SNAPSHOT_TEMPLATE: str = (
+    "----- VM-3P75CT (Modbus/UDP live data) -----\n"
+    "Total active power:        {P_total_W:.1f} W\n"
+    "Total energy forward:      {E_total_forward_kWh:.2f} kWh, "
+    "reverse: {E_total_reverse_kWh:.2f} kWh\n"
+    "Frequency:                 {freq_Hz:.2f} Hz\n"
+    "PEN voltage:               {U_PEN_V:.1f} V\n"
+    "L1: U={U_L1_V:.1f} V, I={I_L1_A:.3f} A, P={P_L1_W:.1f} W, cos φ={PF_L1_s}\n"
+    "    Energy L1 forward:     {E_L1_forward_kWh:.2f} kWh, reverse: {E_L1_reverse_kWh:.2f} kWh\n"
+    "L2: U={U_L2_V:.1f} V, I={I_L2_A:.3f} A, P={P_L2_W:.1f} W, cos φ={PF_L2_s}\n"
+    "    Energy L2 forward:     {E_L2_forward_kWh:.2f} kWh, reverse: {E_L2_reverse_kWh:.2f} kWh\n"
+    "L3: U={U_L3_V:.1f} V, I={I_L3_A:.3f} A, P={P_L3_W:.1f} W, cos φ={PF_L3_s}\n"
+    "    Energy L3 forward:     {E_L3_forward_kWh:.2f} kWh, reverse: {E_L3_reverse_kWh:.2f} kWh\n"
+    "Total power factor:        {PF_total_s}\n"
+    "\n"
+)
+
+#: Power factor keys and the template fields holding their text.
+_PF_TEXT_KEYS: Tuple[Tuple[str, str], ...] = tuple(
+    (key, f"{key}_s") for key in [pf_key for pf_key, *_ in PHASE_KEYS] + ["PF_total"]
+)
+
+
+async def amain() -> None:
     """
-    Main entry point.
+    Asynchronous main loop.
 
-    Creates a ModbusUdpClient, connects to the VM-3P75CT and prints a
+    Creates an AsyncModbusUdpClient, connects to the VM-3P75CT and prints a
     live snapshot of all measurements once per second until interrupted.
     """
-    client = ModbusUdpClient(IP_ADDRESS, port=PORT)
+    client = AsyncModbusUdpClient(IP_ADDRESS, port=PORT)
 
     # Establish UDP connection to the meter.
-    if not client.connect():
+    if not await client.connect():
         print(f"Could not connect to VM-3P75CT at {IP_ADDRESS}:{PORT}")
         print("Check IP address, cabling, and that the meter is powered.")
         return
 
+    buffers = tune_socket(client)
+    if buffers is not None:
+        print(f"UDP socket buffers: receive {buffers[0]} B, send {buffers[1]} B")
+
+    period = POLL_INTERVAL
+    next_t = time.monotonic()
+
     try:
         while True:
-            values = read_all(client)
+            values = await read_all(client)
 
             # If we cannot even read total power, assume something is wrong.
             if values.get("P_total_W") is None:
@@ -448,79 +848,38 @@ def main() -> None:
                       "Check Modbus settings, device ID, and that "
                       "no other Modbus master is using the meter.")
             else:
-                print("----- VM-3P75CT (Modbus/UDP live data) -----")
-                print(f"Total active power:        {values['P_total_W']:.1f} W")
-                print(
-                    f"Total energy forward:      {values['E_total_forward_kWh']:.2f} kWh, "
-                    f"reverse: {values['E_total_reverse_kWh']:.2f} kWh"
-                )
-                print(f"Frequency:                 {values['freq_Hz']:.2f} Hz")
-                print(f"PEN voltage:               {values['U_PEN_V']:.1f} V")
-
-                # Phase L1
-                print(
-                    f"L1: U={values['U_L1_V']:.1f} V, "
-                    f"I={values['I_L1_A']:.3f} A, "
-                    f"P={values['P_L1_W']:.1f} W, "
-                    f"cos φ={values['PF_L1']:.3f}"
-                    if values["PF_L1"] is not None
-                    else f"L1: U={values['U_L1_V']:.1f} V, "
-                         f"I={values['I_L1_A']:.3f} A, "
-                         f"P={values['P_L1_W']:.1f} W, "
-                         "cos φ=NA"
-                )
-                print(
-                    f"    Energy L1 forward:     {values['E_L1_forward_kWh']:.2f} kWh, "
-                    f"reverse: {values['E_L1_reverse_kWh']:.2f} kWh"
-                )
-
-                # Phase L2
-                print(
-                    f"L2: U={values['U_L2_V']:.1f} V, "
-                    f"I={values['I_L2_A']:.3f} A, "
-                    f"P={values['P_L2_W']:.1f} W, "
-                    f"cos φ={values['PF_L2']:.3f}"
-                    if values["PF_L2"] is not None
-                    else f"L2: U={values['U_L2_V']:.1f} V, "
-                         f"I={values['I_L2_A']:.3f} A, "
-                         f"P={values['P_L2_W']:.1f} W, "
-                         "cos φ=NA"
-                )
-                print(
-                    f"    Energy L2 forward:     {values['E_L2_forward_kWh']:.2f} kWh, "
-                    f"reverse: {values['E_L2_reverse_kWh']:.2f} kWh"
-                )
-
-                # Phase L3
-                print(
-                    f"L3: U={values['U_L3_V']:.1f} V, "
-                    f"I={values['I_L3_A']:.3f} A, "
-                    f"P={values['P_L3_W']:.1f} W, "
-                    f"cos φ={values['PF_L3']:.3f}"
-                    if values["PF_L3"] is not None
-                    else f"L3: U={values['U_L3_V']:.1f} V, "
-                         f"I={values['I_L3_A']:.3f} A, "
-                         f"P={values['P_L3_W']:.1f} W, "
-                         "cos φ=NA"
-                )
-                print(
-                    f"    Energy L3 forward:     {values['E_L3_forward_kWh']:.2f} kWh, "
-                    f"reverse: {values['E_L3_reverse_kWh']:.2f} kWh"
-                )
-
-                if values["PF_total"] is not None:
-                    print(f"Total power factor:        {values['PF_total']:.3f}")
-                else:
-                    print("Total power factor:        NA")
-
-                print()
-
-            # Recommended polling interval: 0.5–1.0 s for this meter.
-            time.sleep(1.0)
+                # Render the whole snapshot with one template and one write.
+                pf_text = {
+                    text_key: "NA" if values[key] is None else f"{values[key]:.3f}"
+                    for key, text_key in _PF_TEXT_KEYS
+                }
+                sys.stdout.write(SNAPSHOT_TEMPLATE.format_map(ChainMap(pf_text, values)))
+
+            # Sleep until the next deadline so read/print time does not add
+            # to the period. After a stall longer than one period, restart
+            # the schedule from now instead of bursting to catch up.
+            next_t += period
+            dt = next_t - time.monotonic()
+            if dt > 0:
+                await asyncio.sleep(dt)
+            else:
+                next_t = time.monotonic()
 
     finally:
         client.close()
 
 
+def main() -> None:
+    """
+    Main entry point.
+
+    Runs `amain()` on a fresh asyncio event loop until interrupted.
+    """
+    try:
+        asyncio.run(amain())
+    except KeyboardInterrupt:
+        pass
+
+
 if __name__ == "__main__":
     main()